@@ -4,24 +4,47 @@ Sentence transformer embeddings engine.
 
 import asyncio
 import logging
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 logger = logging.getLogger(__name__)
 
+# Loaded models keyed by name, shared across engine instances (weights are
+# read-only at inference time, so re-creating an engine skips the reload)
+_MODEL_CACHE: dict[str, Any] = {}
+
 
 class EmbeddingEngine:
     """Sentence transformer embedding engine."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_size: int = 0,
+    ) -> None:
         """Initialize the embedding engine.
 
         Args:
             model_name: Name of the sentence-transformers model.
+            cache_size: Number of text embeddings kept in the LRU cache.
+                Rows are stored as float32 arrays (about 1.6 KB for a
+                384-dim model). 0 disables caching.
         """
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, npt.NDArray[np.float32]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         try:
-            from sentence_transformers import SentenceTransformer
+            if model_name not in _MODEL_CACHE:
+                from sentence_transformers import SentenceTransformer
 
-            self.model = SentenceTransformer(model_name)
+                _MODEL_CACHE[model_name] = SentenceTransformer(model_name)
+            self.model = _MODEL_CACHE[model_name]
             self.model_name = model_name
             self.dimensions = self.model.get_sentence_embedding_dimension()
             logger.info(
@@ -54,19 +77,53 @@ class EmbeddingEngine:
         return embeddings
 
     def _encode_sync(self, texts: List[str]) -> List[List[float]]:
-        """Synchronous encoding (runs in thread pool)."""
+        """Synchronous encoding (runs in thread pool).
+
+        Texts already in the cache are served from it; only the remaining
+        unique texts are sent to the model, in a single batch.
+        """
         try:
-            embeddings = self.model.encode(
-                texts,
-                convert_to_numpy=True,
-                normalize_embeddings=True,
-            )
-            return embeddings.tolist()
+            found: dict[str, npt.NDArray[np.float32]] = {}
+            with self._cache_lock:
+                for text in texts:
+                    if text in self._cache:
+                        self._cache.move_to_end(text)
+                        found[text] = self._cache[text]
+
+            missing = list(dict.fromkeys(t for t in texts if t not in found))
+            if missing:
+                embeddings = self.model.encode(
+                    missing,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                )
+                # Copy each row out as float32 so a cached entry neither
+                # keeps the whole batch array alive nor holds Python floats
+                found.update(
+                    (text, row.astype("float32"))
+                    for text, row in zip(missing, embeddings)
+                )
+                self._cache_store(missing, found)
+
+            return [found[text].tolist() for text in texts]
 
         except Exception as e:
             logger.error(f"Encoding error: {e}")
             raise
 
+    def _cache_store(
+        self, texts: List[str], embeddings: dict[str, "npt.NDArray[np.float32]"]
+    ) -> None:
+        """Insert fresh embeddings, evicting least recently used entries."""
+        if self.cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            for text in texts:
+                self._cache[text] = embeddings[text]
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     async def encode_single(self, text: str) -> List[float]:
         """Encode a single text.
 
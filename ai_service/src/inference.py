@@ -2,6 +2,7 @@
 LLaMA inference engine using llama-cpp-python.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import asyncio
 import logging
@@ -27,10 +28,25 @@ class InferenceEngine:
         n_ctx: int = 4096,
         n_threads: int | None = None,
         n_gpu_layers: int = 0,
+        prompt_cache_mb: int = 0,
     ) -> None:
-        """Initialize the inference engine."""
+        """Initialize the inference engine.
+
+        Args:
+            model_path: Path to the GGUF model file.
+            n_ctx: Context window size in tokens.
+            n_threads: CPU threads for llama.cpp (None = auto).
+            n_gpu_layers: Layers to offload to the GPU.
+            prompt_cache_mb: Size of the in-memory KV-state cache. llama.cpp
+                already reuses the prefix shared with the previous prompt
+                (e.g. the system prompt), so this only helps when prompts
+                with different long prefixes take turns, such as the
+                proactive-suggestions job's fixed instruction block
+                alternating with user chat. Each completion then pays for
+                a full state snapshot. 0 disables the cache.
+        """
         try:
-            from llama_cpp import Llama
+            from llama_cpp import Llama, LlamaRAMCache
 
             self.model = Llama(
                 model_path=model_path,
@@ -39,8 +55,18 @@ class InferenceEngine:
                 n_gpu_layers=n_gpu_layers,
                 verbose=False,
             )
+            if prompt_cache_mb > 0:
+                self.model.set_cache(
+                    LlamaRAMCache(capacity_bytes=prompt_cache_mb << 20)
+                )
             self.model_path = model_path
             self.model_name = model_path.split("/")[-1]
+
+            # A llama.cpp context is not thread-safe, so generations run on
+            # one dedicated worker rather than the shared default executor
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="llm"
+            )
             logger.info(f"Loaded model: {self.model_name}")
 
         except ImportError:
@@ -63,7 +89,7 @@ class InferenceEngine:
 
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: self._generate_sync(full_prompt, max_tokens, temperature),
         )
 
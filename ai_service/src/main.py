@@ -4,15 +4,21 @@ TERMIO AI Service
 FastAPI application for AI inference, embeddings, NLU, vision, STT, TTS, and emotion detection.
 """
 
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, Any, AsyncGenerator
+import asyncio
+import base64
+import hashlib
+import io
 import logging
 import os
+import threading
 import time
-import base64
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from .models import (
     ChatRequest,
@@ -42,10 +48,23 @@ from .embeddings import EmbeddingEngine
 from .nlu import IntentClassifier
 from .vision import VisionEngine, decode_base64_image
 
+if TYPE_CHECKING:
+    import httpx
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Serialize responses with orjson when available (much faster for the
+# float-heavy embedding payloads); fall back to the stdlib encoder.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+
+    DefaultResponse: type[JSONResponse] = ORJSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Global engines (initialized on startup)
 inference_engine: InferenceEngine | None = None
 embedding_engine: EmbeddingEngine | None = None
@@ -57,19 +76,47 @@ stt_model_loaded: bool = False
 tts_model_loaded: bool = False
 emotion_model_loaded: bool = False
 
+# Serialized /models payload and its ETag. Model status only changes while
+# the engines load at startup, so it is built once and reset by lifespan().
+models_payload: tuple[bytes, str] | None = None
+
+
+def env_int(name: str, default: int = 0) -> int:
+    """Read a non-negative integer setting, warning on a malformed value.
+
+    Optional tuning knobs fall back to their default instead of raising, so
+    a typo cannot take down the engine they configure.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        logger.warning(f"Invalid {name}={raw!r}, using {default}")
+        return default
+    return value
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     global inference_engine, embedding_engine, nlu_classifier, vision_engine
     global stt_model_loaded, tts_model_loaded, emotion_model_loaded
+    global models_payload, cloud_client
 
     logger.info("Starting TERMIO AI Service...")
 
     # Initialize embedding engine (lightweight, always load)
+    embedding_cache_size = env_int("EMBEDDING_CACHE_SIZE")
     try:
         embedding_model = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-        embedding_engine = EmbeddingEngine(model_name=embedding_model)
+        embedding_engine = EmbeddingEngine(
+            model_name=embedding_model,
+            cache_size=embedding_cache_size,
+        )
         logger.info(f"Loaded embedding model: {embedding_model}")
     except Exception as e:
         logger.warning(f"Failed to load embedding model: {e}")
@@ -77,8 +124,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize inference engine if model path is provided
     model_path = os.getenv("MODEL_PATH")
     if model_path and os.path.exists(model_path):
+        prompt_cache_mb = env_int("LLM_PROMPT_CACHE_MB")
         try:
-            inference_engine = InferenceEngine(model_path=model_path)
+            inference_engine = InferenceEngine(
+                model_path=model_path,
+                prompt_cache_mb=prompt_cache_mb,
+            )
             logger.info(f"Loaded LLM model: {model_path}")
         except Exception as e:
             logger.warning(f"Failed to load LLM model: {e}")
@@ -98,7 +149,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         vision_model = os.getenv(
             "VISION_MODEL", "openai/clip-vit-base-patch32"
         )
-        vision_engine = VisionEngine(clip_model=vision_model)
+        vision_engine = VisionEngine(
+            clip_model=vision_model,
+            quantize=os.getenv("VISION_QUANTIZE") == "true",
+        )
         logger.info(f"Vision engine initialized: {vision_model}")
     except Exception as e:
         logger.warning(f"Failed to initialize vision engine: {e}")
@@ -117,11 +171,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         emotion_model_loaded = True
         logger.info("Emotion Detection enabled (mock/simulated)")
 
+    models_payload = None
+
     yield
 
     # Cleanup
     logger.info("Shutting down TERMIO AI Service...")
 
+    if cloud_client is not None:
+        await cloud_client.aclose()
+        cloud_client = None
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -129,6 +189,7 @@ app = FastAPI(
     description="AI inference, embeddings, NLU, vision, and speech for TERMIO",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 # Add CORS middleware
@@ -318,26 +379,31 @@ async def analyze_image(request: VisionRequest) -> VisionResponse:
 # ============================================================================
 
 
-# Global Whisper model (lazy loaded)
+# Global Whisper model (lazy loaded). Loaders run on executor threads, so
+# the lock keeps concurrent first requests from each loading a copy.
 whisper_model = None
+whisper_lock = threading.Lock()
 
 
-def get_whisper_model():
+def get_whisper_model() -> Any:
     """Get or initialize the Whisper model."""
     global whisper_model
-    if whisper_model is None:
-        try:
-            from faster_whisper import WhisperModel
-            model_size = os.getenv("WHISPER_MODEL_SIZE", "tiny")
-            whisper_model = WhisperModel(
-                model_size,
-                device="auto",
-                compute_type="int8"
-            )
-            logger.info(f"Loaded Whisper model: {model_size}")
-        except Exception as e:
-            logger.warning(f"Failed to load Whisper model: {e}")
-            raise
+    if whisper_model is not None:
+        return whisper_model
+    with whisper_lock:
+        if whisper_model is None:
+            try:
+                from faster_whisper import WhisperModel
+                model_size = os.getenv("WHISPER_MODEL_SIZE", "tiny")
+                whisper_model = WhisperModel(
+                    model_size,
+                    device="auto",
+                    compute_type="int8"
+                )
+                logger.info(f"Loaded Whisper model: {model_size}")
+            except Exception as e:
+                logger.warning(f"Failed to load Whisper model: {e}")
+                raise
     return whisper_model
 
 
@@ -353,36 +419,30 @@ async def speech_to_text(request: SttRequest) -> SttResponse:
         # Decode base64 audio
         audio_bytes = base64.b64decode(request.audio_base64)
         
-        # Save to temporary file (faster-whisper needs a file path)
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(audio_bytes)
-            tmp_path = tmp.name
-        
-        try:
-            # Transcribe using Whisper
+        def _transcribe() -> tuple[str, Any]:
+            # Transcribe using Whisper straight from memory (faster-whisper
+            # decodes file-like objects itself, so no temp file round-trip;
+            # segments decode lazily, so collect them here, off the event loop)
             model = get_whisper_model()
             segments, info = model.transcribe(
-                tmp_path,
+                io.BytesIO(audio_bytes),
                 language=request.language,
                 beam_size=5,
                 vad_filter=True
             )
-            
-            # Collect all segments
-            transcription = " ".join([seg.text for seg in segments])
-            
-            processing_time_ms = int((time.time() - start) * 1000)
-            
-            return SttResponse(
-                text=transcription.strip(),
-                confidence=info.language_probability if info else 0.9,
-                language_detected=info.language if info else (request.language or "en"),
-                processing_time_ms=processing_time_ms
-            )
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_path)
+            return " ".join([seg.text for seg in segments]), info
+
+        loop = asyncio.get_event_loop()
+        transcription, info = await loop.run_in_executor(None, _transcribe)
+        
+        processing_time_ms = int((time.time() - start) * 1000)
+        
+        return SttResponse(
+            text=transcription.strip(),
+            confidence=info.language_probability if info else 0.9,
+            language_detected=info.language if info else (request.language or "en"),
+            processing_time_ms=processing_time_ms
+        )
             
     except Exception as e:
         logger.error(f"STT error: {e}")
@@ -393,52 +453,112 @@ async def speech_to_text(request: SttRequest) -> SttResponse:
 # Text-to-Speech (TTS)
 # ============================================================================
 
-# Global Piper TTS engine (lazy loaded)
+# Global Piper TTS engine (lazy loaded, guarded like the Whisper model)
 piper_engine = None
+piper_lock = threading.Lock()
+
+# Silent WAV placeholder returned when no Piper voice is available
+SILENT_WAV_BASE64 = "UklGRiQAAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAAABkYXRh"
+
+# Recently synthesized audio (base64 WAV), least recently used evicted first,
+# so repeated short phrases ("OK", confirmations) skip synthesis entirely.
+# Only short texts are cached and total size is capped as well as entry
+# count, so long one-off requests cannot pin large buffers.
+TTS_CACHE_SIZE = 256
+TTS_CACHE_MAX_TEXT = 200
+TTS_CACHE_MAX_BYTES = 32 << 20
+tts_cache: OrderedDict[tuple[str, str, float], str] = OrderedDict()
+tts_cache_bytes = 0
 
+# Failed loads are retried at most this often, so a missing model does not
+# cost an import attempt and a filesystem stat on every /tts request
+PIPER_RETRY_SECONDS = 30.0
+piper_failed_at: float | None = None
 
-def get_piper_engine():
+
+def get_piper_engine() -> Any:
     """Get or initialize the Piper TTS engine."""
-    global piper_engine
-    if piper_engine is None:
+    global piper_engine, piper_failed_at
+    if piper_engine is not None:
+        return piper_engine
+    with piper_lock:
+        if piper_engine is not None:
+            return piper_engine
+        if (
+            piper_failed_at is not None
+            and time.monotonic() - piper_failed_at < PIPER_RETRY_SECONDS
+        ):
+            return None
         try:
             from piper_tts import PiperTTS
             model_path = os.getenv("PIPER_MODEL_PATH", "/usr/share/piper/voices/en_US-lessac-medium.onnx")
             if not os.path.exists(model_path):
                 logger.warning(f"Piper model not found at {model_path}, TTS will use fallback")
+                piper_failed_at = time.monotonic()
                 return None
             piper_engine = PiperTTS(model_path)
             logger.info(f"Loaded Piper TTS model: {model_path}")
         except Exception as e:
             logger.warning(f"Failed to load Piper TTS: {e}")
             piper_engine = None
+            piper_failed_at = time.monotonic()
     return piper_engine
 
 
+def cache_tts_audio(key: tuple[str, str, float], audio_base64: str) -> None:
+    """Store synthesized audio, evicting least recently used entries."""
+    global tts_cache_bytes
+    previous = tts_cache.pop(key, None)
+    if previous is not None:
+        tts_cache_bytes -= len(previous)
+    tts_cache[key] = audio_base64
+    tts_cache_bytes += len(audio_base64)
+    while tts_cache and (
+        len(tts_cache) > TTS_CACHE_SIZE or tts_cache_bytes > TTS_CACHE_MAX_BYTES
+    ):
+        _, evicted = tts_cache.popitem(last=False)
+        tts_cache_bytes -= len(evicted)
+
+
 @app.post("/tts", response_model=TtsResponse)
 async def text_to_speech(request: TtsRequest) -> TtsResponse:
     """Synthesize text to speech using Piper TTS."""
     start = time.time()
     
+    cache_key = (request.text, request.voice_id, request.speed)
+    cached_audio = tts_cache.get(cache_key)
+    if cached_audio is not None:
+        tts_cache.move_to_end(cache_key)
+        return TtsResponse(
+            audio_base64=cached_audio,
+            format="wav",
+            processing_time_ms=int((time.time() - start) * 1000)
+        )
+
     try:
-        engine = get_piper_engine()
+        loop = asyncio.get_event_loop()
+        engine = await loop.run_in_executor(None, get_piper_engine)
         
         if engine is None:
             # Fallback: return silence placeholder
             return TtsResponse(
-                audio_base64="UklGRiQAAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAAABkYXRh",
+                audio_base64=SILENT_WAV_BASE64,
                 format="wav",
                 processing_time_ms=int((time.time() - start) * 1000)
             )
         
         # Generate audio
-        import io
         wav_buffer = io.BytesIO()
-        engine.synthesize(request.text, wav_buffer)
+        await loop.run_in_executor(
+            None, lambda: engine.synthesize(request.text, wav_buffer)
+        )
         wav_bytes = wav_buffer.getvalue()
         
         # Encode to base64
         audio_base64 = base64.b64encode(wav_bytes).decode("utf-8")
+
+        if len(request.text) <= TTS_CACHE_MAX_TEXT:
+            cache_tts_audio(cache_key, audio_base64)
         
         process_time_ms = int((time.time() - start) * 1000)
         
@@ -457,25 +577,36 @@ async def text_to_speech(request: TtsRequest) -> TtsResponse:
 # Emotion Detection
 # ============================================================================
 
-# Global emotion model (lazy loaded)
+# Global emotion model (lazy loaded, guarded like the Whisper model)
 emotion_model = None
+emotion_lock = threading.Lock()
+
+# Simulated result served whenever real detection is unavailable (built once)
+EMOTION_FALLBACK = EmotionResponse(
+    emotion="neutral",
+    confidence=0.85,
+    probabilities={"neutral": 0.85, "happy": 0.10, "sad": 0.05},
+)
 
 
-def get_emotion_model():
+def get_emotion_model() -> Any:
     """Get or initialize the emotion detection model."""
     global emotion_model
-    if emotion_model is None:
-        try:
-            from transformers import pipeline
-            emotion_model = pipeline(
-                "audio-classification",
-                model="ehcalabres/wav2vec2-lg-xlsr-53-speech-emotion-recognition",
-                top_k=None
-            )
-            logger.info("Loaded emotion detection model")
-        except Exception as e:
-            logger.warning(f"Failed to load emotion model: {e}")
-            emotion_model = None
+    if emotion_model is not None:
+        return emotion_model
+    with emotion_lock:
+        if emotion_model is None:
+            try:
+                from transformers import pipeline
+                emotion_model = pipeline(
+                    "audio-classification",
+                    model="ehcalabres/wav2vec2-lg-xlsr-53-speech-emotion-recognition",
+                    top_k=None
+                )
+                logger.info("Loaded emotion detection model")
+            except Exception as e:
+                logger.warning(f"Failed to load emotion model: {e}")
+                emotion_model = None
     return emotion_model
 
 
@@ -486,72 +617,63 @@ async def detect_emotion(request: EmotionRequest) -> EmotionResponse:
         # Decode base64 audio
         audio_bytes = base64.b64decode(request.audio_base64)
         
-        # Save to temporary file
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(audio_bytes)
-            tmp_path = tmp.name
+        loop = asyncio.get_event_loop()
+        model = await loop.run_in_executor(None, get_emotion_model)
         
-        try:
-            model = get_emotion_model()
-            
-            if model is None:
-                # Fallback to simulated response
-                return EmotionResponse(
-                    emotion="neutral",
-                    confidence=0.85,
-                    probabilities={
-                        "neutral": 0.85,
-                        "happy": 0.10,
-                        "sad": 0.05
-                    }
-                )
+        if model is None:
+            # Fallback to simulated response
+            return EMOTION_FALLBACK
+        
+        # Run emotion detection (the pipeline decodes raw bytes itself)
+        results = await loop.run_in_executor(None, model, audio_bytes)
+        
+        # Find the dominant emotion
+        if results and len(results) > 0:
+            # Results is a list of dicts with 'label' and 'score'
+            top_result = max(results[0], key=lambda x: x.get("score", 0))
+            emotion = top_result.get("label", "neutral").lower()
+            confidence = top_result.get("score", 0.85)
             
-            # Run emotion detection
-            results = model(tmp_path)
-            
-            # Find the dominant emotion
-            if results and len(results) > 0:
-                # Results is a list of dicts with 'label' and 'score'
-                top_result = max(results[0], key=lambda x: x.get("score", 0))
-                emotion = top_result.get("label", "neutral").lower()
-                confidence = top_result.get("score", 0.85)
-                
-                # Build probability distribution
-                probs = {r.get("label", "unknown").lower(): r.get("score", 0) for r in results[0]}
-                
-                return EmotionResponse(
-                    emotion=emotion,
-                    confidence=confidence,
-                    probabilities=probs
-                )
-            else:
-                return EmotionResponse(
-                    emotion="neutral",
-                    confidence=0.85,
-                    probabilities={"neutral": 0.85, "happy": 0.10, "sad": 0.05}
-                )
-        finally:
-            os.unlink(tmp_path)
+            # Build probability distribution
+            probs = {r.get("label", "unknown").lower(): r.get("score", 0) for r in results[0]}
             
+            return EmotionResponse(
+                emotion=emotion,
+                confidence=confidence,
+                probabilities=probs
+            )
+        else:
+            return EMOTION_FALLBACK
+        
     except Exception as e:
         logger.error(f"Emotion detection error: {e}")
         # Return fallback on error
-        return EmotionResponse(
-            emotion="neutral",
-            confidence=0.85,
-            probabilities={
-                "neutral": 0.85,
-                "happy": 0.10,
-                "sad": 0.05
-            }
-        )
+        return EMOTION_FALLBACK
 
 
 # ============================================================================
 # Cloud Augmentation (consent-gated proxy)
 # ============================================================================
 
+# Shared HTTP client (lazy created) so augment calls reuse pooled
+# keep-alive connections instead of a fresh TCP + TLS handshake each time
+cloud_client: "httpx.AsyncClient | None" = None
+
+
+def get_cloud_client() -> "httpx.AsyncClient":
+    """Get or create the pooled HTTP client for cloud augmentation."""
+    global cloud_client
+    if cloud_client is None:
+        import httpx
+
+        cloud_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=32, max_keepalive_connections=8
+            ),
+        )
+    return cloud_client
+
 
 @app.post("/augment", response_model=AugmentResponse)
 async def augment_with_cloud(request: AugmentRequest) -> AugmentResponse:
@@ -568,24 +690,22 @@ async def augment_with_cloud(request: AugmentRequest) -> AugmentResponse:
     )
 
     try:
-        import httpx
-
         start = time.time()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                cloud_url,
-                json={
-                    "query": request.query,
-                    "context": request.context,
-                    "local_model": request.local_model,
-                    "confidence_threshold": request.confidence_threshold,
-                },
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Request-ID": os.urandom(16).hex(),
-                },
-            )
+        client = get_cloud_client()
+        resp = await client.post(
+            cloud_url,
+            json={
+                "query": request.query,
+                "context": request.context,
+                "local_model": request.local_model,
+                "confidence_threshold": request.confidence_threshold,
+            },
+            headers={
+                "Content-Type": "application/json",
+                "X-Request-ID": os.urandom(16).hex(),
+            },
+        )
 
         processing_time_ms = int((time.time() - start) * 1000)
 
@@ -629,8 +749,31 @@ async def augment_with_cloud(request: AugmentRequest) -> AugmentResponse:
 
 
 @app.get("/models", response_model=ModelListResponse)
-async def list_models() -> ModelListResponse:
-    """List all loaded AI models and their status."""
+async def list_models(request: Request) -> Response:
+    """List all loaded AI models and their status.
+
+    The payload is serialized once and carries an ETag so polling clients
+    can revalidate with If-None-Match and receive an empty 304.
+    """
+    global models_payload
+    if models_payload is None:
+        body = build_model_list().model_dump_json().encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        models_payload = (body, etag)
+
+    body, etag = models_payload
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+def build_model_list() -> ModelListResponse:
+    """Collect the status of every AI model."""
     models: list[ModelInfo] = []
 
     # LLM
@@ -88,14 +88,17 @@ _INTENT_KEYWORDS: dict[IntentType, list[str]] = {
     ],
 }
 
-# Entity extraction patterns
-_ENTITY_PATTERNS: dict[str, str] = {
-    "time": r"\b(\d{1,2}:\d{2}(?:\s*[ap]m)?)\b",
-    "date": r"\b(\d{4}-\d{2}-\d{2}|\b(?:today|tomorrow|yesterday|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b)",
-    "number": r"\b(\d+(?:\.\d+)?)\b",
-    "email": r"\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b",
-    "url": r"(https?://[^\s]+)",
-    "duration": r"\b(\d+\s*(?:minutes?|hours?|days?|weeks?|months?|seconds?))\b",
+# Entity extraction patterns (compiled once at import)
+_ENTITY_PATTERNS: dict[str, re.Pattern[str]] = {
+    entity_type: re.compile(pattern, re.IGNORECASE)
+    for entity_type, pattern in {
+        "time": r"\b(\d{1,2}:\d{2}(?:\s*[ap]m)?)\b",
+        "date": r"\b(\d{4}-\d{2}-\d{2}|\b(?:today|tomorrow|yesterday|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b)",
+        "number": r"\b(\d+(?:\.\d+)?)\b",
+        "email": r"\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b",
+        "url": r"(https?://[^\s]+)",
+        "duration": r"\b(\d+\s*(?:minutes?|hours?|days?|weeks?|months?|seconds?))\b",
+    }.items()
 }
 
 
@@ -232,7 +235,7 @@ def extract_entities(text: str) -> list[Entity]:
     entities: list[Entity] = []
 
     for entity_type, pattern in _ENTITY_PATTERNS.items():
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in pattern.finditer(text):
             entities.append(
                 Entity(
                     entity_type=entity_type,
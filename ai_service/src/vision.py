@@ -47,11 +47,14 @@ class VisionEngine:
     def __init__(
         self,
         clip_model: str = "openai/clip-vit-base-patch32",
+        quantize: bool = False,
     ) -> None:
         """Initialize the vision engine.
 
         Args:
             clip_model: HuggingFace CLIP model name.
+            quantize: Apply dynamic INT8 quantization to the linear layers
+                (smaller weights and faster CPU inference).
         """
         self._model = None
         self._processor = None
@@ -59,17 +62,23 @@ class VisionEngine:
         self.model_name = clip_model
 
         try:
-            self._load_model(clip_model)
+            self._load_model(clip_model, quantize)
         except Exception as e:
             logger.warning(f"Vision engine unavailable: {e}")
 
-    def _load_model(self, model_name: str) -> None:
+    def _load_model(self, model_name: str, quantize: bool = False) -> None:
         """Load CLIP model and processor."""
         try:
             from transformers import CLIPModel, CLIPProcessor
 
             self._processor = CLIPProcessor.from_pretrained(model_name)
             self._model = CLIPModel.from_pretrained(model_name)
+            if quantize:
+                import torch
+
+                self._model = torch.quantization.quantize_dynamic(
+                    self._model, {torch.nn.Linear}, dtype=torch.qint8
+                )
             self._model_loaded = True
             logger.info(f"Loaded vision model: {model_name}")
         except ImportError:
@@ -173,20 +182,19 @@ class VisionEngine:
                 padding=True,
             )
 
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self._model(**inputs)
 
             logits = outputs.logits_per_image[0]
             probs = logits.softmax(dim=0)
 
-            # Get top results
-            sorted_indices = probs.argsort(descending=True)
+            # Get top results (partial selection, no full sort)
+            top_probs, top_indices = probs.topk(min(5, probs.numel()))
             top_labels: list[str] = []
             top_scores: list[float] = []
 
-            for idx in sorted_indices[:5]:
+            for score, idx in zip(top_probs.tolist(), top_indices.tolist()):
                 label = candidate_labels[idx]
-                score = probs[idx].item()
                 if score > 0.05:  # threshold
                     top_labels.append(label)
                     top_scores.append(round(score, 4))
@@ -238,7 +246,7 @@ class VisionEngine:
                 padding=True,
             )
 
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self._model(**inputs)
 
             logits = outputs.logits_per_image[0]
@@ -291,7 +299,6 @@ def decode_base64_image(b64_string: str) -> bytes:
     Returns:
         Raw image bytes.
     """
-    # Strip data URI prefix if present
-    if "," in b64_string:
-        b64_string = b64_string.split(",", 1)[1]
-    return base64.b64decode(b64_string)
+    # Strip data URI prefix if present (single scan for the separator)
+    _, sep, payload = b64_string.partition(",")
+    return base64.b64decode(payload if sep else b64_string)
@@ -1,8 +1,11 @@
 """Integration tests for the TERMIO AI Service API."""
 
+from collections import OrderedDict
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 
+from src import main
 from src.main import app
 
 
@@ -62,6 +65,17 @@ async def test_models_endpoint(client):
     assert len(data["models"]) >= 4
 
 
+@pytest.mark.anyio
+async def test_models_not_modified(client):
+    """GET /models with a matching If-None-Match should return 304."""
+    response = await client.get("/models")
+    etag = response.headers["etag"]
+
+    response = await client.get("/models", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
 @pytest.mark.anyio
 async def test_augment_requires_consent(client):
     """POST /augment without consent should return 403."""
@@ -75,9 +89,13 @@ async def test_augment_requires_consent(client):
     assert response.status_code == 403
 
 
+@pytest.mark.slow
 @pytest.mark.anyio
 async def test_augment_with_consent(client):
-    """POST /augment with consent should attempt augmentation."""
+    """POST /augment with consent should attempt augmentation.
+
+    Makes a real request to CLOUD_AUGMENT_URL (up to the 30s timeout).
+    """
     response = await client.post(
         "/augment",
         json={
@@ -99,3 +117,43 @@ async def test_embeddings_without_model(client):
     )
     # May return 503 if embedding engine not loaded
     assert response.status_code in (200, 503)
+
+
+@pytest.mark.anyio
+async def test_tts_repeated_text_is_cached(client, monkeypatch):
+    """POST /tts should reuse audio synthesized for an identical request."""
+    synthesized = []
+
+    class FakePiper:
+        def synthesize(self, text, wav_file):
+            synthesized.append(text)
+            wav_file.write(b"RIFF")
+
+    monkeypatch.setattr(main, "piper_engine", FakePiper())
+    monkeypatch.setattr(main, "tts_cache", OrderedDict())
+    monkeypatch.setattr(main, "tts_cache_bytes", 0)
+
+    first = await client.post("/tts", json={"text": "Hello"})
+    second = await client.post("/tts", json={"text": "Hello"})
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["audio_base64"] == second.json()["audio_base64"]
+    assert synthesized == ["Hello"]
+
+    # Long texts are synthesized every time rather than cached
+    long_text = "x" * (main.TTS_CACHE_MAX_TEXT + 1)
+    await client.post("/tts", json={"text": long_text})
+    await client.post("/tts", json={"text": long_text})
+
+    assert synthesized == ["Hello", long_text, long_text]
+    assert list(main.tts_cache) == [("Hello", "default", 1.0)]
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("64", 64), ("0", 0), ("abc", 0), ("-3", 0), ("", 0)],
+)
+def test_env_int_falls_back_on_bad_values(monkeypatch, raw, expected):
+    """Malformed or negative settings should fall back to the default."""
+    monkeypatch.setenv("TERMIO_TEST_SETTING", raw)
+    assert main.env_int("TERMIO_TEST_SETTING") == expected
@@ -0,0 +1,67 @@
+"""Tests for the embedding engine's LRU cache."""
+
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import embeddings  # noqa: E402
+from src.embeddings import EmbeddingEngine  # noqa: E402
+
+
+class StubModel:
+    """Stands in for a SentenceTransformer and records each encode batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, **kwargs):
+        self.batches.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Register a stub model so the engine skips sentence-transformers."""
+    stub = StubModel()
+    monkeypatch.setitem(embeddings._MODEL_CACHE, "stub", stub)
+    return stub
+
+
+def test_duplicates_and_repeats_encoded_once(model):
+    """Duplicate texts and repeat calls should reach the model only once."""
+    engine = EmbeddingEngine(model_name="stub", cache_size=8)
+
+    first = asyncio.run(engine.encode(["a", "bb", "a"]))
+    second = asyncio.run(engine.encode(["bb", "a"]))
+
+    assert model.batches == [["a", "bb"]]
+    assert first == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert second == [first[1], first[0]]
+    assert all(isinstance(x, float) for x in first[0])
+
+
+def test_eviction_is_least_recently_used(model):
+    """A full cache should evict the entry that was used least recently."""
+    engine = EmbeddingEngine(model_name="stub", cache_size=2)
+
+    asyncio.run(engine.encode(["a", "b"]))
+    asyncio.run(engine.encode(["a"]))  # "b" is now least recently used
+    asyncio.run(engine.encode(["c"]))
+    asyncio.run(engine.encode(["a", "b"]))
+
+    assert model.batches == [["a", "b"], ["c"], ["b"]]
+
+
+def test_zero_cache_size_disables_caching(model):
+    """With cache_size=0 every call should reach the model."""
+    engine = EmbeddingEngine(model_name="stub", cache_size=0)
+
+    asyncio.run(engine.encode(["a"]))
+    asyncio.run(engine.encode(["a"]))
+
+    assert model.batches == [["a"], ["a"]]
@@ -6,43 +6,30 @@ import pytest
 from src.nlu import IntentClassifier, IntentType, extract_entities
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def classifier():
-    """Create a classifier instance without ML model."""
+    """Create a classifier instance without ML model (shared, stateless)."""
     return IntentClassifier()
 
 
-def test_conversation_intent(classifier):
-    """General conversation should classify as CONVERSATION."""
-    result = asyncio.run(classifier.classify("Hello, how are you doing today?"))
-    assert result.intent == IntentType.CONVERSATION
-
-
-def test_action_request_intent(classifier):
-    """Action keywords should classify as ACTION_REQUEST."""
-    result = asyncio.run(classifier.classify("Please book a meeting for tomorrow"))
-    assert result.intent == IntentType.ACTION_REQUEST
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Hello, how are you doing today?", IntentType.CONVERSATION),
+        ("Please book a meeting for tomorrow", IntentType.ACTION_REQUEST),
+        ("Do you remember what I said yesterday?", IntentType.MEMORY_QUERY),
+        ("What was my heart rate this morning?", IntentType.HEALTH_QUERY),
+        ("Turn off the living room lights", IntentType.DEVICE_CONTROL),
+    ],
+    ids=["conversation", "action_request", "memory_query", "health_query", "device_control"],
+)
+def test_intent_classification(classifier, text, expected):
+    """Each utterance should classify as its expected intent."""
+    result = asyncio.run(classifier.classify(text))
+    assert result.intent == expected
     assert result.confidence > 0
 
 
-def test_memory_query_intent(classifier):
-    """Memory-related queries should classify as MEMORY_QUERY."""
-    result = asyncio.run(classifier.classify("Do you remember what I said yesterday?"))
-    assert result.intent == IntentType.MEMORY_QUERY
-
-
-def test_health_query_intent(classifier):
-    """Health-related queries should classify as HEALTH_QUERY."""
-    result = asyncio.run(classifier.classify("What was my heart rate this morning?"))
-    assert result.intent == IntentType.HEALTH_QUERY
-
-
-def test_device_control_intent(classifier):
-    """Device control commands should classify correctly."""
-    result = asyncio.run(classifier.classify("Turn off the living room lights"))
-    assert result.intent == IntentType.DEVICE_CONTROL
-
-
 def test_entity_extraction_time():
     """Time entities should be extracted."""
     entities = extract_entities("Meeting at 3:30 pm")